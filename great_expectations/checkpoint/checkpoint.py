@@ -177,15 +177,16 @@ class Checkpoint:
     def _substitute_config_variables(
         self, config: CheckpointConfig
     ) -> CheckpointConfig:
+        environment_variables = dict(os.environ)
         substituted_config_variables = substitute_all_config_variables(
             self.data_context.config_variables,
-            dict(os.environ),
+            environment_variables,
             self.data_context.DOLLAR_SIGN_ESCAPE_STRING,
         )
 
         substitutions = {
             **substituted_config_variables,
-            **dict(os.environ),
+            **environment_variables,
             **self.data_context.runtime_environment,
         }
 
@@ -4,10 +4,9 @@ import smtplib
 import ssl
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
+from functools import lru_cache
 from typing import Optional, Union
 
-import requests
-
 import great_expectations.exceptions as ge_exceptions
 from great_expectations.core.batch import BatchRequest, RuntimeBatchRequest
 from great_expectations.core.util import nested_update
@@ -15,16 +14,53 @@ from great_expectations.data_context.types.base import CheckpointConfig
 
 logger = logging.getLogger(__name__)
 
+NOTIFICATION_MAX_RETRIES = 3
+# (connect, read) timeouts in seconds, so that an unresponsive endpoint cannot hang a checkpoint run
+NOTIFICATION_TIMEOUT = (3.05, 10)
+
+
+@lru_cache(maxsize=None)
+def _get_notification_session():
+    """Return a shared requests.Session, so that repeated notifications reuse pooled connections."""
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
 
-def send_slack_notification(query, slack_webhook):
     session = requests.Session()
+    # Only failures to connect are retried, which can never result in a duplicate notification.
+    # With at most 3 retries and a 0.3 s backoff factor, an unreachable endpoint blocks a
+    # checkpoint run for about 2 s of backoff plus the connect timeouts, rather than minutes.
+    adapter = HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=10,
+        max_retries=Retry(
+            total=NOTIFICATION_MAX_RETRIES,
+            connect=NOTIFICATION_MAX_RETRIES,
+            read=0,
+            status=0,
+            backoff_factor=0.3,
+        ),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def send_slack_notification(query, slack_webhook):
+    import requests
+
+    session = _get_notification_session()
 
     try:
-        response = session.post(url=slack_webhook, json=query)
+        response = session.post(
+            url=slack_webhook, json=query, timeout=NOTIFICATION_TIMEOUT
+        )
     except requests.ConnectionError:
         logger.warning(
             "Failed to connect to Slack webhook at {url} "
-            "after {max_retries} retries.".format(url=slack_webhook, max_retries=10)
+            "after {max_retries} retries.".format(
+                url=slack_webhook, max_retries=NOTIFICATION_MAX_RETRIES
+            )
         )
     except Exception as e:
         logger.error(str(e))
@@ -44,6 +80,8 @@ def send_slack_notification(query, slack_webhook):
 
 def send_opsgenie_alert(query, suite_name, settings):
     """Creates an alert in Opsgenie."""
+    import requests
+
     if settings["region"] != None:
         url = "https://api.{region}.opsgenie.com/v2/alerts".format(
             region=settings["region"]
@@ -62,10 +100,12 @@ def send_opsgenie_alert(query, suite_name, settings):
         "priority": settings["priority"],  # allow this to be modified in settings
     }
 
-    session = requests.Session()
+    session = _get_notification_session()
 
     try:
-        response = session.post(url, headers=headers, json=payload)
+        response = session.post(
+            url, headers=headers, json=payload, timeout=NOTIFICATION_TIMEOUT
+        )
     except requests.ConnectionError:
         logger.warning("Failed to connect to Opsgenie")
     except Exception as e:
@@ -86,14 +126,18 @@ def send_opsgenie_alert(query, suite_name, settings):
 
 
 def send_microsoft_teams_notifications(query, microsoft_teams_webhook):
-    session = requests.Session()
+    import requests
+
+    session = _get_notification_session()
     try:
-        response = session.post(url=microsoft_teams_webhook, json=query)
+        response = session.post(
+            url=microsoft_teams_webhook, json=query, timeout=NOTIFICATION_TIMEOUT
+        )
     except requests.ConnectionError:
         logger.warning(
             "Failed to connect to Microsoft Teams webhook at {url} "
             "after {max_retries} retries.".format(
-                url=microsoft_teams_webhook, max_retries=10
+                url=microsoft_teams_webhook, max_retries=NOTIFICATION_MAX_RETRIES
             )
         )
     except Exception as e:
@@ -114,15 +158,17 @@ def send_microsoft_teams_notifications(query, microsoft_teams_webhook):
 
 
 def send_webhook_notifications(query, webhook, target_platform):
-    session = requests.Session()
+    import requests
+
+    session = _get_notification_session()
     try:
-        response = session.post(url=webhook, json=query)
+        response = session.post(url=webhook, json=query, timeout=NOTIFICATION_TIMEOUT)
     except requests.ConnectionError:
         logger.warning(
             "Failed to connect to {target_platform} webhook at {url} "
             "after {max_retries} retries.".format(
                 url=webhook,
-                max_retries=10,
+                max_retries=NOTIFICATION_MAX_RETRIES,
                 target_platform=target_platform,
             )
         )
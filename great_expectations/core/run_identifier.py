@@ -45,6 +45,8 @@ class RunIdentifier(DataContextKey):
             # this takes given time and converts to utc
             run_time = run_time.astimezone(tz=datetime.timezone.utc)
         self._run_time = run_time
+        # Formatted lazily, since keys are converted to tuples repeatedly by the stores.
+        self._run_time_str = None
 
     @property
     def run_name(self):
@@ -54,16 +56,21 @@ class RunIdentifier(DataContextKey):
     def run_time(self):
         return self._run_time
 
+    def _get_run_time_str(self):
+        if self._run_time_str is None:
+            self._run_time_str = self._run_time.strftime("%Y%m%dT%H%M%S.%fZ")
+        return self._run_time_str
+
     def to_tuple(self):
         return (
             self._run_name or "__none__",
-            self._run_time.strftime("%Y%m%dT%H%M%S.%fZ"),
+            self._get_run_time_str(),
         )
 
     def to_fixed_length_tuple(self):
         return (
             self._run_name or "__none__",
-            self._run_time.strftime("%Y%m%dT%H%M%S.%fZ"),
+            self._get_run_time_str(),
         )
 
     def __repr__(self):
@@ -11,7 +11,6 @@ from queue import Queue
 from typing import Optional
 
 import jsonschema
-import requests
 
 from great_expectations import __version__ as ge_version
 from great_expectations.core.usage_statistics.anonymizers.anonymizer import Anonymizer
@@ -94,6 +93,8 @@ class UsageStatisticsHandler:
         self._worker.join()
 
     def _requests_worker(self):
+        import requests
+
         session = requests.Session()
         while True:
             message = self._message_queue.get()
@@ -907,15 +907,16 @@ class BaseDataContext:
         if not config:
             config = self._project_config
 
+        environment_variables = dict(os.environ)
         substituted_config_variables = substitute_all_config_variables(
             self.config_variables,
-            dict(os.environ),
+            environment_variables,
             self.DOLLAR_SIGN_ESCAPE_STRING,
         )
 
         substitutions = {
             **substituted_config_variables,
-            **dict(os.environ),
+            **environment_variables,
             **self.runtime_environment,
         }
 
@@ -3016,6 +3017,8 @@ Generated, evaluated, and stored %d Expectations during profiling. Please review
             config_defaults={
                 "module_name": "great_expectations.checkpoint.checkpoint",
             },
+            # filter_properties_dict has already made a deep copy of checkpoint_config
+            unsafe=True,
         )
         key: ConfigurationIdentifier = ConfigurationIdentifier(
             configuration_key=name,
@@ -3081,6 +3084,8 @@ Generated, evaluated, and stored %d Expectations during profiling. Please review
             config_defaults={
                 "module_name": "great_expectations.checkpoint",
             },
+            # filter_properties_dict has already made a deep copy of config
+            unsafe=True,
         )
 
         return checkpoint
@@ -3218,16 +3223,17 @@ Generated, evaluated, and stored %d Expectations during profiling. Please review
             raise ValueError(f"Unknown return_mode: {return_mode}.")
 
         try:
+            environment_variables: dict = dict(os.environ)
             substituted_config_variables: Union[
                 DataContextConfig, dict
             ] = substitute_all_config_variables(
                 self.config_variables,
-                dict(os.environ),
+                environment_variables,
             )
 
             substitutions: dict = {
                 **substituted_config_variables,
-                **dict(os.environ),
+                **environment_variables,
                 **self.runtime_environment,
             }
 
@@ -3692,22 +3698,12 @@ class DataContext(BaseDataContext):
         for directory in cls.BASE_DIRECTORIES:
             if directory == "plugins":
                 plugins_dir = os.path.join(base_dir, directory)
-                os.makedirs(plugins_dir, exist_ok=True)
-                os.makedirs(
-                    os.path.join(plugins_dir, "custom_data_docs"), exist_ok=True
-                )
-                os.makedirs(
-                    os.path.join(plugins_dir, "custom_data_docs", "views"),
-                    exist_ok=True,
-                )
-                os.makedirs(
-                    os.path.join(plugins_dir, "custom_data_docs", "renderers"),
-                    exist_ok=True,
-                )
-                os.makedirs(
-                    os.path.join(plugins_dir, "custom_data_docs", "styles"),
-                    exist_ok=True,
-                )
+                # os.makedirs creates the intermediate plugins/custom_data_docs directories as needed
+                for subdir in ("views", "renderers", "styles"):
+                    os.makedirs(
+                        os.path.join(plugins_dir, "custom_data_docs", subdir),
+                        exist_ok=True,
+                    )
                 cls.scaffold_custom_data_docs(plugins_dir)
             else:
                 os.makedirs(os.path.join(base_dir, directory), exist_ok=True)
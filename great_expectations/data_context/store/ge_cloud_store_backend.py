@@ -3,8 +3,6 @@ from abc import ABCMeta
 from typing import Dict, Optional
 from urllib.parse import urljoin
 
-import requests
-
 from great_expectations.data_context.store.store_backend import StoreBackend
 from great_expectations.data_context.types.refs import GeCloudResourceRef
 from great_expectations.exceptions import StoreBackendError
@@ -69,6 +67,8 @@ class GeCloudStoreBackend(StoreBackend, metaclass=ABCMeta):
         }
 
     def _get(self, key):
+        import requests
+
         ge_cloud_url = self.get_url_for_key(key=key)
         response = requests.get(ge_cloud_url, headers=self.auth_headers)
         return response.json()
@@ -77,6 +77,8 @@ class GeCloudStoreBackend(StoreBackend, metaclass=ABCMeta):
         pass
 
     def _set(self, key, value, **kwargs):
+        import requests
+
         data = {
             "data": {
                 "type": self.ge_cloud_resource_type,
@@ -125,6 +127,8 @@ class GeCloudStoreBackend(StoreBackend, metaclass=ABCMeta):
         return self._ge_cloud_credentials
 
     def list_keys(self):
+        import requests
+
         url = urljoin(
             self.ge_cloud_base_url,
             f"accounts/"
@@ -149,6 +153,8 @@ class GeCloudStoreBackend(StoreBackend, metaclass=ABCMeta):
         return url
 
     def remove_key(self, key):
+        import requests
+
         if not isinstance(key, tuple):
             key = key.to_tuple()
 
@@ -1,14 +1,13 @@
 import base64
-import copy
 import inspect
 import json
 import logging
 import os
 import re
 import warnings
-from collections import OrderedDict
+from copy import deepcopy
 from functools import lru_cache
-from typing import Optional
+from typing import Iterable, Optional, Tuple
 from urllib.parse import urlparse
 
 try:
@@ -49,16 +48,39 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Non-escaped ${SOME_VARIABLE} or $SOME_VARIABLE references.
+CONFIG_VARIABLE_PATTERN = re.compile(
+    r"(?<!\\)\$\{(.*?)\}|(?<!\\)\$([_a-zA-Z][_a-zA-Z0-9]*)"
+)
+GCP_SECRET_MANAGER_PREFIX_PATTERN = re.compile(
+    r"^secret\|projects\/[a-z0-9\_\-]{6,30}\/secrets"
+)
+AZURE_KEYVAULT_PREFIX_PATTERN = re.compile(
+    r"^secret\|https:\/\/[a-zA-Z0-9\-]{3,24}\.vault\.azure\.net"
+)
+
 
 # TODO: Rename config to constructor_kwargs and config_defaults -> constructor_kwarg_default
 # TODO: Improve error messages in this method. Since so much of our workflow is config-driven, this will be a *super* important part of DX.
-def instantiate_class_from_config(config, runtime_environment, config_defaults=None):
-    """Build a GE class from configuration dictionaries."""
+def instantiate_class_from_config(
+    config, runtime_environment, config_defaults=None, unsafe: bool = False
+):
+    """Build a GE class from configuration dictionaries.
+
+    If unsafe is True, config and config_defaults are consumed instead of copied: they may be mutated,
+    both here and by the instantiated class, and must not be used by the caller afterward.
+    """
 
     if config_defaults is None:
         config_defaults = {}
+    elif not unsafe:
+        # config_defaults are always flat dicts of scalars built by the caller, so a shallow copy is
+        # enough to keep the pops below from leaking back.
+        config_defaults = dict(config_defaults)
 
-    config = copy.deepcopy(config)
+    if not unsafe:
+        # The instantiated classes are free to mutate nested values of config (e.g., store_backend).
+        config = deepcopy(config)
 
     module_name = config.pop("module_name", None)
     if module_name is None:
@@ -98,8 +120,7 @@ def instantiate_class_from_config(config, runtime_environment, config_defaults=N
 
     class_ = load_class(class_name=class_name, module_name=module_name)
 
-    config_with_defaults = copy.deepcopy(config_defaults)
-    config_with_defaults.update(config)
+    config_with_defaults = {**config_defaults, **config}
     if runtime_environment is not None:
         # If there are additional kwargs available in the runtime_environment requested by a
         # class to be instantiated, provide them
@@ -166,7 +187,30 @@ def build_store_from_config(
 def format_dict_for_error_message(dict_):
     # TODO : Tidy this up a bit. Indentation isn't fully consistent.
 
-    return "\n\t".join("\t\t".join((str(key), str(dict_[key]))) for key in dict_)
+    return "\n\t".join(
+        "\t\t".join((str(key), str(value))) for key, value in dict_.items()
+    )
+
+
+def _parse_whole_string_config_variable_name(template_str: str) -> Optional[str]:
+    """
+    Return SOME_VARIABLE if template_str consists of exactly one ${SOME_VARIABLE} or $SOME_VARIABLE
+    reference (as CONFIG_VARIABLE_PATTERN would match it), or None if the regex is needed to decide.
+    """
+    if template_str.count("$") != 1:
+        return None
+
+    if template_str.startswith("${"):
+        name = template_str[2:-1]
+        if template_str.endswith("}") and name and "}" not in name and "\n" not in name:
+            return name
+    elif template_str.startswith("$"):
+        name = template_str[1:]
+        # CONFIG_VARIABLE_PATTERN only accepts ASCII identifiers in this form
+        if name.isidentifier() and max(name) <= "\x7f":
+            return name
+
+    return None
 
 
 def substitute_config_variable(
@@ -199,27 +243,33 @@ def substitute_config_variable(
     :return: a string with values substituted, or the same object if template_str is not a string.
     """
 
-    if template_str is None:
+    if not isinstance(template_str, str):
+        # If the value is not a string (e.g., None or a boolean), we should return it as is
         return template_str
 
-    # 1. Make substitutions for non-escaped patterns
-    try:
-        match = re.finditer(
-            r"(?<!\\)\$\{(.*?)\}|(?<!\\)\$([_a-zA-Z][_a-zA-Z0-9]*)", template_str
+    # 1. Make substitutions for non-escaped patterns (most config values contain no "$" at all)
+    references: Iterable[Tuple[str, str]] = ()
+    if "$" in template_str:
+        whole_string_variable_name = _parse_whole_string_config_variable_name(
+            template_str
         )
-    except TypeError:
-        # If the value is not a string (e.g., a boolean), we should return it as is
-        return template_str
+        if whole_string_variable_name is not None:
+            # The common case of a value that is just ${SOME_VARIABLE} or $SOME_VARIABLE needs no regex.
+            references = ((template_str, whole_string_variable_name),)
+        else:
+            # Match either the first group e.g. ${Variable} or the second e.g. $Variable
+            references = (
+                (m.group(), m.group(1) or m.group(2))
+                for m in CONFIG_VARIABLE_PATTERN.finditer(template_str)
+            )
 
-    for m in match:
-        # Match either the first group e.g. ${Variable} or the second e.g. $Variable
-        config_variable_name = m.group(1) or m.group(2)
+    for reference, config_variable_name in references:
         config_variable_value = config_variables_dict.get(config_variable_name)
 
         if config_variable_value is not None:
             if not isinstance(config_variable_value, str):
                 return config_variable_value
-            template_str = template_str.replace(m.group(), config_variable_value)
+            template_str = template_str.replace(reference, config_variable_value)
         else:
             raise ge_exceptions.MissingConfigVariableError(
                 f"""\n\nUnable to find a match for config substitution variable: `{config_variable_name}`.
@@ -262,11 +312,9 @@ def substitute_value_from_secret_store(value):
     if isinstance(value, str) and value.startswith("secret|"):
         if value.startswith("secret|arn:aws:secretsmanager"):
             return substitute_value_from_aws_secrets_manager(value)
-        elif re.compile(r"^secret\|projects\/[a-z0-9\_\-]{6,30}\/secrets").match(value):
+        elif GCP_SECRET_MANAGER_PREFIX_PATTERN.match(value):
             return substitute_value_from_gcp_secret_manager(value)
-        elif re.compile(
-            r"^secret\|https:\/\/[a-zA-Z0-9\-]{3,24}\.vault\.azure\.net"
-        ).match(value):
+        elif AZURE_KEYVAULT_PREFIX_PATTERN.match(value):
             return substitute_value_from_azure_keyvault(value)
     return value
 
@@ -445,6 +493,29 @@ def substitute_value_from_azure_keyvault(value):
     return secret
 
 
+def _may_need_substitution(value, dollar_sign_escape_string: str) -> bool:
+    """
+    Return False for config values that substitute_config_variable would return unchanged: non-string
+    scalars, and strings with no variable reference, no escaped "$", and no secret store reference.
+    """
+    if isinstance(value, (dict, list, tuple)):
+        return True
+    if not isinstance(value, str):
+        return False
+    return (
+        "$" in value
+        or dollar_sign_escape_string in value
+        or value.startswith("secret|")
+    )
+
+
+class _PendingTuple:
+    """A tuple whose elements are being substituted in a list, to be turned back into a tuple afterward."""
+
+    def __init__(self, items: list):
+        self.items = items
+
+
 def substitute_all_config_variables(
     data, replace_variables_dict, dollar_sign_escape_string: str = r"\$"
 ):
@@ -452,7 +523,8 @@ def substitute_all_config_variables(
     Substitute all config variables of the form ${SOME_VARIABLE} in a dictionary-like
     config object for their values.
 
-    The method traverses the dictionary recursively.
+    The method walks the dictionary with an explicit stack instead of recursing, building new
+    dictionaries, lists, and tuples along the way, so the input object is left untouched.
 
     :param data:
     :param replace_variables_dict:
@@ -464,18 +536,51 @@ def substitute_all_config_variables(
     if isinstance(data, CheckpointConfig):
         data = CheckpointConfigSchema().dump(data)
 
-    if isinstance(data, dict) or isinstance(data, OrderedDict):
-        return {
-            k: substitute_all_config_variables(v, replace_variables_dict)
-            for k, v in data.items()
-        }
-    elif isinstance(data, list):
-        return [
-            substitute_all_config_variables(v, replace_variables_dict) for v in data
-        ]
-    return substitute_config_variable(
-        data, replace_variables_dict, dollar_sign_escape_string
-    )
+    substitution_cache: dict = {}
+
+    # Leaves that cannot change are copied along with their container and never pushed on the stack.
+    # Each stack entry is (container, key, value): the substituted value gets written to container[key].
+    # Children are pushed in reverse so that the values are visited in their original order.
+    result: list = [None]
+    stack: list = [(result, 0, data)]
+    while stack:
+        container, key, value = stack.pop()
+        if isinstance(value, dict):
+            substituted_dict: dict = dict(value)
+            container[key] = substituted_dict
+            stack.extend(
+                (substituted_dict, k, v)
+                for k, v in reversed(list(value.items()))
+                if _may_need_substitution(v, dollar_sign_escape_string)
+            )
+        elif isinstance(value, list) or type(value) is tuple:
+            # Plain tuples only: named tuples cannot be rebuilt from a single iterable.
+            substituted_list: list = list(value)
+            container[key] = substituted_list
+            if isinstance(value, tuple):
+                # Pushed below the elements, so it is popped only once all of them have been substituted.
+                stack.append((container, key, _PendingTuple(substituted_list)))
+            stack.extend(
+                (substituted_list, idx, substituted_list[idx])
+                for idx in reversed(range(len(substituted_list)))
+                if _may_need_substitution(
+                    substituted_list[idx], dollar_sign_escape_string
+                )
+            )
+        elif isinstance(value, _PendingTuple):
+            container[key] = tuple(value.items)
+        elif isinstance(value, str):
+            # Configs tend to repeat the same references (e.g., "${AWS_REGION}") across many leaves.
+            try:
+                container[key] = substitution_cache[value]
+            except KeyError:
+                container[key] = substitution_cache[value] = substitute_config_variable(
+                    value, replace_variables_dict, dollar_sign_escape_string
+                )
+        else:
+            container[key] = value
+
+    return result[0]
 
 
 def file_relative_path(dunderfile, relative_path):
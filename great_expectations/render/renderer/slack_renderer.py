@@ -9,6 +9,14 @@ from .renderer import Renderer
 
 
 class SlackRenderer(Renderer):
+    DEFAULT_TEXT = (
+        "No validation occurred. Please ensure you passed a validation_result."
+    )
+    DOCUMENTATION_URL = "https://docs.greatexpectations.io/en/latest/guides/tutorials/getting_started/set_up_data_docs.html"
+    FOOTER_TEXT = (
+        f"Learn how to review validation results in Data Docs: {DOCUMENTATION_URL}"
+    )
+
     def __init__(self):
         super().__init__()
 
@@ -18,9 +26,7 @@ class SlackRenderer(Renderer):
         data_docs_pages=None,
         notify_with=None,
     ):
-        default_text = (
-            "No validation occurred. Please ensure you passed a validation_result."
-        )
+        default_text = self.DEFAULT_TEXT
         status = "Failed :x:"
 
         title_block = {
@@ -122,22 +128,21 @@ class SlackRenderer(Renderer):
                 }
                 query["blocks"].append(dataset_element)
 
-        documentation_url = "https://docs.greatexpectations.io/en/latest/guides/tutorials/getting_started/set_up_data_docs.html"
-        footer_section = {
-            "type": "context",
-            "elements": [
-                {
-                    "type": "mrkdwn",
-                    "text": f"Learn how to review validation results in Data Docs: {documentation_url}",
-                }
-            ],
-        }
-
-        divider_block = {"type": "divider"}
-        query["blocks"].append(divider_block)
-        query["blocks"].append(footer_section)
+        query["blocks"].extend(self._get_footer_blocks())
         return query
 
+    @classmethod
+    def _get_footer_blocks(cls):
+        # The blocks are handed to the caller as part of the query, so they are rebuilt on every call,
+        # but all of their text is formatted once at class definition time.
+        return [
+            {"type": "divider"},
+            {
+                "type": "context",
+                "elements": [{"type": "mrkdwn", "text": cls.FOOTER_TEXT}],
+            },
+        ]
+
     def _get_report_element(self, docs_link):
         report_element = None
         if docs_link:
@@ -7,6 +7,7 @@ import logging
 import os
 import pstats
 import re
+import sys
 import time
 from collections import OrderedDict
 from datetime import datetime
@@ -274,12 +275,28 @@ templates, and assets is supported in your execution environment.  This error is
         raise FileNotFoundError(message)
 
 
+def _get_initialized_module(module_name: str) -> Optional[ModuleType]:
+    """
+    :param module_name: a fully-qualified name of a module
+    :return: the module from sys.modules, unless it is absent or still being imported (e.g., by another thread)
+    """
+    module_obj: Optional[ModuleType] = sys.modules.get(module_name)
+    if module_obj is None or getattr(
+        getattr(module_obj, "__spec__", None), "_initializing", False
+    ):
+        return None
+    return module_obj
+
+
 def import_library_module(module_name: str) -> Optional[ModuleType]:
     """
     :param module_name: a fully-qualified name of a module (e.g., "great_expectations.dataset.sqlalchemy_dataset")
     :return: raw source code of the module (if can be retrieved)
     """
-    module_obj: Optional[ModuleType]
+    module_obj: Optional[ModuleType] = _get_initialized_module(module_name=module_name)
+    if module_obj is not None:
+        # Fully imported; skip the import machinery (and its lock) for repeat lookups.
+        return module_obj
 
     try:
         module_obj = importlib.import_module(module_name)
@@ -303,10 +320,14 @@ def load_class(class_name: str, module_name: str):
         raise TypeError("module_name must not be None")
     if not isinstance(module_name, str):
         raise TypeError("module_name must be a string")
-    try:
-        verify_dynamic_loading_support(module_name=module_name)
-    except FileNotFoundError:
-        raise PluginModuleNotFoundError(module_name)
+
+    # Only look for the module's spec when it has not been imported yet; the class itself is looked up on every
+    # call, so that a reloaded module's classes are returned.
+    if _get_initialized_module(module_name=module_name) is None:
+        try:
+            verify_dynamic_loading_support(module_name=module_name)
+        except FileNotFoundError:
+            raise PluginModuleNotFoundError(module_name)
 
     module_obj: Optional[ModuleType] = import_library_module(module_name=module_name)
 
@@ -3,9 +3,16 @@ from unittest import mock
 
 import pytest
 from freezegun import freeze_time
+from requests import ConnectionError as RequestsConnectionError
 from requests import Session
 
-from great_expectations.checkpoint.util import smtplib
+from great_expectations.checkpoint.util import (
+    NOTIFICATION_MAX_RETRIES,
+    NOTIFICATION_TIMEOUT,
+    _get_notification_session,
+    send_slack_notification,
+    smtplib,
+)
 from great_expectations.core.expectation_validation_result import (
     ExpectationSuiteValidationResult,
 )
@@ -95,7 +102,9 @@ def test_StoreAction():
     )
 
 
+@mock.patch.object(Session, "post", side_effect=RequestsConnectionError)
 def test_SlackNotificationAction(
+    mock_post,
     data_context_parameterized_expectation_suite,
     validation_result_suite,
     validation_result_suite_id,
@@ -165,7 +174,9 @@ def test_PagerdutyAlertAction(
     )
 
 
+@mock.patch.object(Session, "post", side_effect=RequestsConnectionError)
 def test_OpsgenieAlertAction(
+    mock_post,
     data_context_parameterized_expectation_suite,
     validation_result_suite,
     validation_result_suite_id,
@@ -209,6 +220,28 @@ def test_OpsgenieAlertAction(
     )
 
 
+def test_notification_session_retries_only_connection_errors():
+    session = _get_notification_session()
+    for prefix in ["https://", "http://"]:
+        max_retries = session.get_adapter(prefix).max_retries
+        assert max_retries.total == NOTIFICATION_MAX_RETRIES
+        assert max_retries.connect == NOTIFICATION_MAX_RETRIES
+        assert max_retries.read == 0
+        assert max_retries.status == 0
+
+
+@mock.patch.object(Session, "post", return_value=MockTeamsResponse(200))
+def test_send_slack_notification_passes_timeout(mock_post):
+    slack_webhook = "https://hooks.slack.com/services/test/slack/webhook"
+    assert (
+        send_slack_notification({"text": "test"}, slack_webhook)
+        == "Slack notification succeeded."
+    )
+    mock_post.assert_called_once_with(
+        url=slack_webhook, json={"text": "test"}, timeout=NOTIFICATION_TIMEOUT
+    )
+
+
 @mock.patch.object(Session, "post", return_value=MockTeamsResponse(200))
 def test_MicrosoftTeamsNotificationAction_good_request(
     data_context_parameterized_expectation_suite,
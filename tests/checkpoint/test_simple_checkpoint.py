@@ -1,6 +1,8 @@
 from unittest.mock import patch
 
 import pytest
+from requests import ConnectionError as RequestsConnectionError
+from requests import Session
 
 import great_expectations.exceptions as ge_exceptions
 from great_expectations import DataContext
@@ -533,8 +535,12 @@ def test_simple_checkpoint_runtime_kwargs_processing_site_names_only_without_per
     ) == filter_properties_dict(properties=expected_runtime_kwargs, clean_falsy=True)
 
 
+@patch.object(Session, "post", side_effect=RequestsConnectionError)
 def test_simple_checkpoint_runtime_kwargs_processing_slack_webhook_only_without_persisting_checkpoint(
-    context_with_data_source_and_empty_suite, simple_checkpoint_defaults, one_validation
+    mock_post,
+    context_with_data_source_and_empty_suite,
+    simple_checkpoint_defaults,
+    one_validation,
 ):
     # verify Checkpoint is not persisted in the data context
     assert context_with_data_source_and_empty_suite.list_checkpoints() == []
@@ -809,7 +815,9 @@ def test_simple_checkpoint_runtime_kwargs_processing_all_kwargs(
     ) == filter_properties_dict(properties=expected_runtime_kwargs, clean_falsy=True)
 
 
+@patch.object(Session, "post", side_effect=RequestsConnectionError)
 def test_simple_checkpoint_defaults_run_and_basic_run_params_with_persisted_checkpoint_loaded_from_store(
+    mock_post,
     context_with_data_source_and_empty_suite,
     simple_checkpoint_defaults,
     webhook,
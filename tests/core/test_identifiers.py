@@ -7,3 +7,50 @@ def test_run_identifier_parses_datetime_run_name():
     time = datetime.datetime.now(datetime.timezone.utc).strftime("%Y%m%dT%H%M%S.%fZ")
     run_id = RunIdentifier(run_name=time)
     assert run_id.run_name == run_id.run_time.strftime("%Y%m%dT%H%M%S.%fZ")
+
+
+def test_run_identifier_tuples_are_stable_across_repeated_calls():
+    run_time = datetime.datetime(2021, 3, 4, 5, 6, 7, 890123, datetime.timezone.utc)
+    run_id = RunIdentifier(run_name="my_run", run_time=run_time)
+    expected_tuple = ("my_run", "20210304T050607.890123Z")
+
+    for _ in range(3):
+        assert run_id.to_tuple() == expected_tuple
+        assert run_id.to_fixed_length_tuple() == expected_tuple
+
+    unnamed_run_id = RunIdentifier(run_time=run_time)
+    for _ in range(3):
+        assert unnamed_run_id.to_tuple() == ("__none__", "20210304T050607.890123Z")
+
+
+def test_run_identifier_equality_and_hash_across_repeated_calls():
+    run_time = datetime.datetime(2021, 3, 4, 5, 6, 7, 890123, datetime.timezone.utc)
+    run_id = RunIdentifier(run_name="my_run", run_time=run_time)
+    same_run_id = RunIdentifier(run_name="my_run", run_time=run_time)
+    later_run_id = RunIdentifier(
+        run_name="my_run", run_time=run_time + datetime.timedelta(microseconds=1)
+    )
+
+    for _ in range(3):
+        assert run_id == same_run_id
+        assert hash(run_id) == hash(same_run_id)
+        assert run_id != later_run_id
+    assert len({run_id, same_run_id, later_run_id}) == 2
+
+
+def test_run_identifier_from_tuple_round_trip():
+    run_id = RunIdentifier(
+        run_name="my_run",
+        run_time=datetime.datetime(2021, 3, 4, 5, 6, 7, 890123, datetime.timezone.utc),
+    )
+
+    round_tripped = RunIdentifier.from_tuple(run_id.to_tuple())
+    assert round_tripped == run_id
+    assert round_tripped.run_time == run_id.run_time
+    assert round_tripped.to_tuple() == run_id.to_tuple()
+
+    round_tripped = RunIdentifier.from_fixed_length_tuple(
+        run_id.to_fixed_length_tuple()
+    )
+    assert round_tripped == run_id
+    assert hash(round_tripped) == hash(run_id)
@@ -13,6 +13,7 @@ from great_expectations.data_context.types.base import (
 )
 from great_expectations.data_context.util import (
     file_relative_path,
+    substitute_all_config_variables,
     substitute_config_variable,
 )
 from great_expectations.exceptions import InvalidConfigError, MissingConfigVariableError
@@ -351,6 +352,46 @@ See https://great-expectations.readthedocs.io/en/latest/reference/data_context_r
     )
 
 
+def test_substitute_all_config_variables_handles_nested_config_without_mutating_it():
+    config_variables_dict = {"arg0": "val_of_arg_0", "arg1": 1}
+    config = OrderedDict(
+        {
+            "name": "${arg0}",
+            "nested": {"values": ["$arg0", {"deep": "$arg1"}, 3, None], "flag": True},
+        }
+    )
+
+    assert substitute_all_config_variables(config, config_variables_dict) == {
+        "name": "val_of_arg_0",
+        "nested": {"values": ["val_of_arg_0", {"deep": 1}, 3, None], "flag": True},
+    }
+    assert config == OrderedDict(
+        {
+            "name": "${arg0}",
+            "nested": {"values": ["$arg0", {"deep": "$arg1"}, 3, None], "flag": True},
+        }
+    )
+
+    with pytest.raises(MissingConfigVariableError) as exc:
+        substitute_all_config_variables(
+            {"first": "$missing_0", "second": ["$missing_1"]}, config_variables_dict
+        )
+    assert exc.value.missing_config_variable == "missing_0"
+
+
+def test_substitute_all_config_variables_handles_tuples():
+    config_variables_dict = {"arg0": "val_of_arg_0"}
+
+    substituted_config = substitute_all_config_variables(
+        {"values": ("$arg0", {"nested": ("${arg0}", 1)}, "plain")},
+        config_variables_dict,
+    )
+    assert substituted_config == {
+        "values": ("val_of_arg_0", {"nested": ("val_of_arg_0", 1)}, "plain")
+    }
+    assert isinstance(substituted_config["values"], tuple)
+
+
 def test_substitute_env_var_in_config_variable_file(
     monkeypatch, empty_data_context_with_config_variables
 ):
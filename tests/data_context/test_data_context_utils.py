@@ -48,6 +48,37 @@ def test_load_class_raises_error_when_module_name_is_not_string():
             load_class(bad_input, "great_expectations.datasource")
 
 
+def test_load_class_skips_spec_lookup_for_imported_module():
+    from great_expectations.datasource import Datasource
+
+    with mock.patch(
+        "great_expectations.util.verify_dynamic_loading_support"
+    ) as mock_verify:
+        assert load_class("Datasource", "great_expectations.datasource") is Datasource
+    mock_verify.assert_not_called()
+
+
+def test_load_class_returns_class_from_reloaded_module(tmp_path, monkeypatch):
+    import importlib
+    import sys
+
+    module_name = "reloadable_plugin_module"
+    module_path = tmp_path / f"{module_name}.py"
+    module_path.write_text("class MyPlugin:\n    version = 1\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.setattr(sys, "dont_write_bytecode", True)
+    monkeypatch.delitem(sys.modules, module_name, raising=False)
+
+    assert load_class("MyPlugin", module_name).version == 1
+
+    module_path.write_text("class MyPlugin:\n    version = 22\n")
+    module_obj = importlib.reload(sys.modules[module_name])
+
+    reloaded_class = load_class("MyPlugin", module_name)
+    assert reloaded_class.version == 22
+    assert reloaded_class is module_obj.MyPlugin
+
+
 def test_password_masker_mask_db_url(monkeypatch, tmp_path):
     """
     What does this test and why?
@@ -177,3 +177,41 @@ def test_instantiate_class_from_config_with_config_defaults():
             "a": "value_from_the_config",
         },
     )
+
+
+def test_instantiate_class_from_config_does_not_mutate_inputs():
+    config = {
+        "module_name": "tests.test_plugins.fake_configs",
+        "class_name": "FakeConfigurableClass",
+        "a": "value_from_the_config",
+    }
+    config_defaults = {"module_name": "tests.test_plugins.fake_configs"}
+
+    instantiate_class_from_config(
+        config=config,
+        runtime_environment={"x": 1},
+        config_defaults=config_defaults,
+    )
+    assert config == {
+        "module_name": "tests.test_plugins.fake_configs",
+        "class_name": "FakeConfigurableClass",
+        "a": "value_from_the_config",
+    }
+    assert config_defaults == {"module_name": "tests.test_plugins.fake_configs"}
+
+
+def test_instantiate_class_from_config_unsafe_consumes_inputs():
+    config = {
+        "module_name": "tests.test_plugins.fake_configs",
+        "class_name": "FakeConfigurableClass",
+        "a": "value_from_the_config",
+    }
+
+    fake_configurable_object = instantiate_class_from_config(
+        config=config,
+        runtime_environment={"x": 1},
+        unsafe=True,
+    )
+    assert fake_configurable_object.a == "value_from_the_config"
+    # module_name and class_name were popped from the caller's dictionary instead of a copy.
+    assert config == {"a": "value_from_the_config"}
@@ -1,5 +1,7 @@
 import copy
 import os
+import sys
+from unittest import mock
 
 import pytest
 
@@ -9,6 +11,7 @@ from great_expectations.dataset.util import check_sql_engine_dialect
 from great_expectations.util import (
     filter_properties_dict,
     get_currently_executing_function_call_arguments,
+    import_library_module,
     lint_code,
 )
 
@@ -229,6 +232,29 @@ def test_nested_update_lists():
     }
 
 
+def test_import_library_module_returns_already_imported_module():
+    module_obj = import_library_module(module_name="great_expectations.util")
+    assert module_obj is sys.modules["great_expectations.util"]
+
+
+def test_import_library_module_defers_to_import_machinery_while_module_is_initializing(
+    monkeypatch,
+):
+    module_obj = sys.modules["great_expectations.util"]
+    monkeypatch.setattr(module_obj.__spec__, "_initializing", True, raising=False)
+    with mock.patch(
+        "great_expectations.util.importlib.import_module", return_value=module_obj
+    ) as mock_import_module:
+        assert import_library_module(module_name="great_expectations.util") is (
+            module_obj
+        )
+    mock_import_module.assert_called_once_with("great_expectations.util")
+
+
+def test_import_library_module_returns_none_for_missing_module():
+    assert import_library_module(module_name="totally_not_a_real_module") is None
+
+
 def test_linter_raises_error_on_non_string_input():
     with pytest.raises(TypeError):
         lint_code(99)